@@ -1,6 +1,5 @@
 """Banking AI Notebooks - Financial calculation utilities."""
 
-from .financial_engine import FinancialEngine, engine
 from .utils import is_kaggle, is_colab, get_environment, setup_environment
 
 __all__ = [
@@ -12,3 +11,18 @@ __all__ = [
     "setup_environment",
 ]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    """Lazily import the financial engine (and its numpy/pandas deps) on first access."""
+    if name in ("FinancialEngine", "engine"):
+        from . import financial_engine
+
+        value = getattr(financial_engine, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
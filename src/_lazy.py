@@ -0,0 +1,39 @@
+"""Deferred imports for heavy optional-at-call-time dependencies.
+
+Example:
+    >>> pd = lazy_import("pandas")  # nothing imported yet
+    >>> pd.DataFrame({"a": [1]})    # pandas imported here, on first use
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule:
+    """Proxy that imports the wrapped module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return a proxy for module ``name`` that imports it on first use.
+
+    Args:
+        name: Fully qualified module name, e.g. ``"pandas"``.
+
+    Returns:
+        Proxy object forwarding attribute access to the real module.
+    """
+    return _LazyModule(name)
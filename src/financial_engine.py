@@ -13,11 +13,20 @@ Why use numpy-financial?
 - Well-tested and maintained by the community
 """
 
-from typing import Protocol
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
 
 import numpy as np
 import numpy_financial as npf
-import pandas as pd
+
+from ._lazy import lazy_import
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    # pandas is only needed for amortization tables; defer its import
+    pd = lazy_import("pandas")
 
 
 class PaymentCalculator(Protocol):
@@ -179,14 +188,16 @@ class FinancialEngine:
         monthly_rate = rate / 12
         pmt = float(-npf.pmt(monthly_rate, periods, principal))
 
-        # Vectorized calculation - all periods at once
+        # Vectorized closed-form schedule - all periods at once.
+        # Balance after month m: B_m = P*(1+r)^m - PMT*((1+r)^m - 1)/r
         per = np.arange(1, periods + 1)
-        interest = -npf.ipmt(monthly_rate, per, periods, principal)
-        principal_paid = -npf.ppmt(monthly_rate, per, periods, principal)
+        growth = (1 + monthly_rate) ** per
+        balance = principal * growth - pmt * (growth - 1) / monthly_rate
 
-        # Calculate balance using cumulative principal paid
-        # This avoids sign convention issues with npf.fv
-        balance = principal - np.cumsum(principal_paid)
+        # Each month's interest accrues on the previous month's balance
+        balance_prev = np.concatenate(([principal], balance))[:-1]
+        interest = balance_prev * monthly_rate
+        principal_paid = pmt - interest
 
         # Fix floating point errors
         balance = np.maximum(0, balance)
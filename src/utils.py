@@ -2,12 +2,43 @@
 
 This module provides utilities to detect whether code is running
 on Kaggle or locally, and handles path differences accordingly.
+
+The environment cannot change within a process, so it is detected once
+at import time and exposed as module-level constants (IS_KAGGLE,
+IS_COLAB, ENVIRONMENT, DATA_PATH, OUTPUT_PATH).
 """
 
 import os
 import sys
+from functools import cache
 from pathlib import Path
 
+_PKG_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _PKG_DIR.parent
+
+IS_KAGGLE = "KAGGLE_KERNEL_RUN_TYPE" in os.environ
+IS_COLAB = "COLAB_GPU" in os.environ or "google.colab" in sys.modules
+ENVIRONMENT = "kaggle" if IS_KAGGLE else ("colab" if IS_COLAB else "local")
+
+if IS_KAGGLE:
+    DATA_PATH = Path("/kaggle/input")
+    OUTPUT_PATH = Path("/kaggle/working")
+elif IS_COLAB:
+    DATA_PATH = Path("/content/drive/MyDrive/data")
+    OUTPUT_PATH = Path("/content")
+else:
+    # Local: relative to project root
+    DATA_PATH = _PROJECT_ROOT / "data"
+    OUTPUT_PATH = _PROJECT_ROOT / "output"
+
+_ENV_INFO = {
+    "name": ENVIRONMENT,
+    "is_kaggle": IS_KAGGLE,
+    "is_colab": IS_COLAB,
+    "data_path": DATA_PATH,
+    "output_path": OUTPUT_PATH,
+}
+
 
 def is_kaggle() -> bool:
     """Detect if running in Kaggle environment.
@@ -15,7 +46,7 @@ def is_kaggle() -> bool:
     Returns:
         True if running on Kaggle, False otherwise.
     """
-    return "KAGGLE_KERNEL_RUN_TYPE" in os.environ
+    return IS_KAGGLE
 
 
 def is_colab() -> bool:
@@ -24,7 +55,7 @@ def is_colab() -> bool:
     Returns:
         True if running on Colab, False otherwise.
     """
-    return "COLAB_GPU" in os.environ or "google.colab" in sys.modules
+    return IS_COLAB
 
 
 def get_environment() -> str:
@@ -33,12 +64,7 @@ def get_environment() -> str:
     Returns:
         One of: 'kaggle', 'colab', 'local'
     """
-    if is_kaggle():
-        return "kaggle"
-    elif is_colab():
-        return "colab"
-    else:
-        return "local"
+    return ENVIRONMENT
 
 
 def get_data_path(filename: str = "") -> Path:
@@ -59,15 +85,14 @@ def get_data_path(filename: str = "") -> Path:
         Path('/kaggle/input/loans.csv')  # on Kaggle
         Path('data/loans.csv')           # locally
     """
-    if is_kaggle():
-        base = Path("/kaggle/input")
-    elif is_colab():
-        base = Path("/content/drive/MyDrive/data")
-    else:
-        # Local: relative to project root
-        base = Path(__file__).parent.parent / "data"
+    return DATA_PATH / filename if filename else DATA_PATH
 
-    return base / filename if filename else base
+
+@cache
+def _local_output_base() -> Path:
+    """Create the local output directory on first use and return it."""
+    OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_PATH
 
 
 def get_output_path(filename: str = "") -> Path:
@@ -79,18 +104,17 @@ def get_output_path(filename: str = "") -> Path:
     Returns:
         Path object pointing to the output directory or file.
     """
-    if is_kaggle():
-        base = Path("/kaggle/working")
-    elif is_colab():
-        base = Path("/content")
-    else:
-        base = Path(__file__).parent.parent / "output"
+    # Local output directory is created on first use
+    base = _local_output_base() if ENVIRONMENT == "local" else OUTPUT_PATH
+    return base / filename if filename else base
 
-    # Create directory if it doesn't exist (for local)
-    if not is_kaggle() and not is_colab():
-        base.mkdir(parents=True, exist_ok=True)
 
-    return base / filename if filename else base
+@cache
+def _ensure_on_path() -> None:
+    """Put the project root on sys.path (once) so ``import src`` works locally."""
+    root = str(_PROJECT_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
 
 
 def setup_environment():
@@ -111,22 +135,15 @@ def setup_environment():
         >>> env['name']
         'local'
     """
-    env_name = get_environment()
-    print(f"Environment: {env_name}")
-
-    # For local development, ensure src is in path
-    if env_name == "local":
-        src_path = Path(__file__).parent
-        if str(src_path) not in sys.path:
-            sys.path.insert(0, str(src_path.parent))
-
-    return {
-        "name": env_name,
-        "is_kaggle": is_kaggle(),
-        "is_colab": is_colab(),
-        "data_path": get_data_path(),
-        "output_path": get_output_path(),
-    }
+    print(f"Environment: {ENVIRONMENT}")
+
+    # For local development, ensure src is in path and output dir exists
+    if ENVIRONMENT == "local":
+        _ensure_on_path()
+        _local_output_base()
+
+    # Copy so callers can't mutate the shared info
+    return dict(_ENV_INFO)
 
 
 # Convenience: print environment on import if running interactively
@@ -1,7 +1,8 @@
 """Tests for the FinancialEngine class."""
 
+import math
+
 import pytest
-import numpy as np
 from src.financial_engine import FinancialEngine
 
 
@@ -175,6 +176,13 @@ class TestAmortizationTable:
         assert all(table["payment"] == 1000)
         assert table.iloc[-1]["balance"] == 0
 
+    def test_empty_table(self, engine):
+        """Test that a zero-period schedule yields an empty table."""
+        table = engine.amortization_table(50000, 0.05, 0)
+
+        assert table.shape == (0, 5)
+        assert list(table.columns) == ["month", "payment", "principal", "interest", "balance"]
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
@@ -183,13 +191,13 @@ class TestEdgeCases:
         """Test with very high interest rate."""
         payment = engine.payment(10000, 0.24, 12)  # 24% APR
         assert payment > 0
-        assert not np.isnan(payment)
+        assert not math.isnan(payment)
 
     def test_very_long_term(self, engine):
         """Test with very long loan term (40 years)."""
         payment = engine.payment(500000, 0.05, 480)
         assert payment > 0
-        assert not np.isnan(payment)
+        assert not math.isnan(payment)
 
     def test_small_principal(self, engine):
         """Test with small principal amount."""